@@ -1,10 +1,14 @@
+import asyncio
+import functools
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
 from fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 import json
@@ -16,6 +20,93 @@ from tools.general_tools import get_config_value
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts: fail fast on a dead connection, but give the API time to answer
+_REQUEST_TIMEOUT = (5, 30)
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled HTTP session shared by every Alpha Vantage request.
+
+    A new AlphaVantageNewsTool is built per tool call, so the session lives at module
+    level to keep TCP/TLS connections alive across calls instead of re-handshaking.
+    """
+    # read=0: a read timeout already waited the full 30 s and may have spent quota, so only
+    # connect errors and gateway statuses are retried
+    retry = Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.05,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _request_news_feed(base_url: str, params_items: Tuple[Tuple[str, Any], ...]) -> Tuple[Dict[str, Any], ...]:
+    """Call the NEWS_SENTIMENT endpoint and return its feed.
+
+    Args:
+        base_url: Alpha Vantage query URL
+        params_items: Query parameters as sorted (key, value) pairs, hashable for caching
+
+    Returns:
+        Tuple of news articles, at most params["limit"] long
+    """
+    params = dict(params_items)
+    try:
+        response = _SESSION.get(base_url, params=params, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        json_data = response.json()
+        
+        # Check for API errors
+        if "Error Message" in json_data:
+            raise Exception(f"Alpha Vantage API error: {json_data['Error Message']}")
+        if "Note" in json_data:
+            raise Exception(f"Alpha Vantage API note: {json_data['Note']}")
+        if "Information" in json_data:
+            raise Exception(f"Alpha Vantage API rate limit: {json_data['Information']}")
+
+        # Extract feed data
+        feed = json_data.get("feed", [])
+        
+        if not feed:
+            print(f"⚠️ Alpha Vantage API returned empty feed")
+            return ()
+
+        return tuple(feed[:params["limit"]])
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Alpha Vantage API request failed: {e}")
+        raise Exception(f"Alpha Vantage API request failed: {e}")
+    except Exception as e:
+        logger.error(f"Alpha Vantage API error: {e}")
+        raise
+
+
+class _EmptyNewsFeed(Exception):
+    """Raised through the LRU so an empty feed is never memoized."""
+
+
+def _request_nonempty_news_feed(base_url: str, params_items: Tuple[Tuple[str, Any], ...]) -> Tuple[Dict[str, Any], ...]:
+    feed = _request_news_feed(base_url, params_items)
+    if not feed:
+        raise _EmptyNewsFeed()
+    return feed
+
+
+# Feeds run up to 20 articles with long summaries, so the LRU is bounded well below
+# the number of distinct (symbol, date) queries a backtest can issue. Errors and
+# empty feeds are raised, never cached.
+_request_news_feed_cached = functools.lru_cache(maxsize=1024)(_request_nonempty_news_feed)
+
 
 def parse_date_to_standard(date_str: str) -> str:
     """
@@ -131,33 +222,14 @@ class AlphaVantageNewsTool:
         if time_to:
             params["time_to"] = time_to
 
-        try:
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            json_data = response.json()
-            
-            # Check for API errors
-            if "Error Message" in json_data:
-                raise Exception(f"Alpha Vantage API error: {json_data['Error Message']}")
-            if "Note" in json_data:
-                raise Exception(f"Alpha Vantage API note: {json_data['Note']}")
-
-            # Extract feed data
-            feed = json_data.get("feed", [])
-            
-            if not feed:
-                print(f"⚠️ Alpha Vantage API returned empty feed")
+        params_items = tuple(sorted(params.items()))
+        if time_to:
+            # A closed historical window always returns the same feed, so serve repeats from memory
+            try:
+                return list(_request_news_feed_cached(self.base_url, params_items))
+            except _EmptyNewsFeed:
                 return []
-
-            return feed[:params["limit"]]
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Alpha Vantage API request failed: {e}")
-            raise Exception(f"Alpha Vantage API request failed: {e}")
-        except Exception as e:
-            logger.error(f"Alpha Vantage API error: {e}")
-            raise
+        return list(_request_news_feed(self.base_url, params_items))
 
     def __call__(
         self,
@@ -220,7 +292,7 @@ mcp = FastMCP("Search")
 
 
 @mcp.tool()
-def get_market_news(
+async def get_market_news(
     query: str,
     tickers: Optional[str] = None,
     topics: Optional[str] = None
@@ -248,7 +320,8 @@ def get_market_news(
     """
     try:
         tool = AlphaVantageNewsTool()
-        results = tool(query=query, tickers=tickers, topics=topics)
+        # The HTTP request blocks, so run it off the event loop to let concurrent tool calls overlap
+        results = await asyncio.to_thread(tool, query=query, tickers=tickers, topics=topics)
 
         # Check if results are empty
         if not results:
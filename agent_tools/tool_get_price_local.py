@@ -1,26 +1,71 @@
 import json
+import mmap
+import multiprocessing
 import os
+import pickle
+import re
 import sys
-from datetime import datetime
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date as _date
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+try:
+    # orjson parses the large merged JSONL records several times faster than the stdlib.
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _tool_serializer(data: Any) -> str:
+        """Serialize tool results into MCP text content with orjson."""
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=str, option=option).decode()
+
+except ImportError:
+    _json_loads = json.loads
+    # FastMCP falls back to its default serializer
+    _tool_serializer = None
+
 # Add parent directory to Python path to import tools module
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 load_dotenv()
 
-mcp = FastMCP("LocalPrices")
+mcp = FastMCP("LocalPrices", tool_serializer=_tool_serializer)
 
 # Ensure project root is on sys.path for absolute imports like `tools.*`
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from tools.general_tools import get_config_value
+from tools.general_tools import get_config_value, get_runtime_env_path
+
+# TODAY_DATE moves with every simulated trading step, so it is cached only until the
+# runtime config file changes rather than for a fixed time.
+_TODAY_CACHE: Dict[str, Any] = {"stamp": None, "value": None}
+
+
+def _get_today() -> Optional[str]:
+    """Return TODAY_DATE, re-reading the runtime config only when its file has changed."""
+    path = get_runtime_env_path()
+    try:
+        st = os.stat(path)
+        stamp = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        # Missing or unreadable: get_config_value falls back to the environment
+        stamp = (path,)
+    if stamp != _TODAY_CACHE["stamp"]:
+        _TODAY_CACHE["value"] = get_config_value("TODAY_DATE")
+        _TODAY_CACHE["stamp"] = stamp
+    return _TODAY_CACHE["value"]
 
 
 def _workspace_data_path(filename: str, symbol: Optional[str] = None) -> Path:
@@ -50,15 +95,360 @@ def _workspace_data_path(filename: str, symbol: Optional[str] = None) -> Path:
         return base_dir / "data" / filename
 
 
-def _validate_date_daily(date_str: str) -> None:
+# In-memory price cache, filled from the merged JSONL files on first lookup and reloaded
+# when a lookup misses after those files changed (see _reload_if_sources_changed).
+# Layout: _PRICE_CACHE[symbol][cache_type] -> {date: (open, high, low, close, volume)},
+# cache_type is 'daily' or 'hourly'. Rows are packed into tuples instead of keeping the
+# per-row JSON dicts, which carry five string keys each.
+_PRICE_CACHE: Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]] = {}
+# Cache lifecycle. Lookups only test for _CACHE_READY; the init lock is taken solely
+# for the one-time unloaded -> loading -> ready transition.
+_CACHE_UNLOADED, _CACHE_LOADING, _CACHE_READY = 0, 1, 2
+_cache_state = [_CACHE_UNLOADED]
+_CACHE_INIT_LOCK = threading.Lock()
+# _cache_sources_signature() as of the last load, compared on lookup misses so data
+# refreshed while the service runs is picked up without a restart.
+_cache_signature: List[Optional[List[Optional[Tuple[str, int, int]]]]] = [None]
+
+# Read-only (symbol, date key) -> row indices built from _PRICE_CACHE once loading finishes,
+# so a cache hit is a single dict probe. Date keys are the ints from _parse_date_daily /
+# _parse_date_hourly, which the request validation produces anyway.
+_DAILY_FLAT: Dict[Tuple[str, int], Tuple[Any, ...]] = {}
+_HOURLY_FLAT: Dict[Tuple[str, int], Tuple[Any, ...]] = {}
+# cache_type -> symbol -> dates in ascending order, so a miss can list recent dates
+# without sorting the whole series and range reads can bisect.
+_DATES_BY_SYMBOL: Dict[str, Dict[str, List[str]]] = {"daily": {}, "hourly": {}}
+# (cache_type, symbol) -> (dates, float64 close prices), built on first get_symbol_returns call.
+_CLOSE_COLUMNS: Dict[Tuple[str, str], Tuple[List[str], Any]] = {}
+
+# (file, ((series key, cache type), ...)) for every file the lookups read. Daily rows are
+# routed per symbol by _workspace_data_path; hourly rows always come from data/merged.jsonl.
+_CACHE_SOURCES: Tuple[Tuple[Path, Tuple[Tuple[str, str], ...]], ...] = (
+    (
+        _workspace_data_path("merged.jsonl"),
+        (("Time Series (Daily)", "daily"), ("Time Series (60min)", "hourly")),
+    ),
+    (_workspace_data_path("merged.jsonl", ".SH"), (("Time Series (Daily)", "daily"),)),
+    (_workspace_data_path("merged.jsonl", "-USDT"), (("Time Series (Daily)", "daily"),)),
+)
+
+# Below this much JSONL, starting worker processes costs more than parsing inline.
+_PARALLEL_LOAD_MIN_BYTES = 64 * 1024 * 1024
+
+# The parsed cache is persisted here so restarts skip the JSONL parse when the sources are unchanged.
+_CACHE_SNAPSHOT_PATH = Path(__file__).resolve().parents[1] / "data" / "_cache" / "prices.pkl"
+# Bump whenever the _PRICE_CACHE layout changes so older snapshots are ignored.
+_CACHE_SNAPSHOT_VERSION = 1
+
+
+def _iter_jsonl_records(file_path: Path):
+    """Yield the raw bytes of each non-blank line of a JSONL file via mmap.
+
+    The OS page cache does the I/O and lines are sliced straight out of the
+    mapping, skipping Python's text-mode line iteration and UTF-8 decoding.
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            end = len(mm)
+            while start < end:
+                nl = mm.find(b"\n", start)
+                if nl == -1:
+                    nl = end
+                if nl != start:
+                    line = mm[start:nl]
+                    # Same as the old line.strip() check: whitespace-only and CRLF-blank lines are skipped
+                    if not line.isspace():
+                        yield line
+                start = nl + 1
+
+
+def _load_jsonl_to_cache_worker(
+    file_path: Path, series_types: Tuple[Tuple[str, str], ...]
+) -> Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]]:
+    """Parse one merged JSONL file into a partial price cache.
+
+    Kept at module level so it can run in a worker process. As with the old
+    per-request scan, the first record of a symbol in a file wins. Lines that are not
+    JSON objects are skipped with a single warning per file.
+
+    Returns:
+        Mapping of symbol -> cache_type -> {date: ohlcv row}, same layout as _PRICE_CACHE.
+    """
+    partial: Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]] = {}
+    if not file_path.exists():
+        return partial
+
+    bad_lines = 0
+    for line in _iter_jsonl_records(file_path):
+        try:
+            doc = _json_loads(line)
+        except ValueError:
+            bad_lines += 1
+            continue
+        if not isinstance(doc, dict):
+            bad_lines += 1
+            continue
+        symbol = doc.get("Meta Data", {}).get("2. Symbol")
+        if symbol is None:
+            continue
+        # Intern symbols and dates: the same trading dates repeat across every symbol
+        symbol = sys.intern(symbol)
+        entry = partial.setdefault(symbol, {})
+        for series_key, cache_type in series_types:
+            # Daily lookups only read the file their symbol routes to
+            if cache_type == "daily" and _workspace_data_path("merged.jsonl", symbol) != file_path:
+                continue
+            if cache_type in entry:
+                continue
+            entry[cache_type] = {
+                sys.intern(date): (
+                    day.get("1. buy price"),
+                    day.get("2. high"),
+                    day.get("3. low"),
+                    day.get("4. sell price"),
+                    day.get("5. volume"),
+                )
+                for date, day in doc.get(series_key, {}).items()
+            }
+    if bad_lines:
+        # One corrupt record should not take down lookups for every other symbol
+        print(f"⚠️  Warning: skipped {bad_lines} malformed line(s) in {file_path}")
+    return partial
+
+
+def _reintern_partial(
+    partial: Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]]
+) -> Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]]:
+    """Re-intern the symbols and dates of a partial that came back from a worker process.
+
+    Unpickling yields fresh string objects, so without this every source would
+    carry its own copy of the shared trading dates.
+    """
+    return {
+        sys.intern(symbol): {
+            cache_type: {sys.intern(date): row for date, row in series.items()}
+            for cache_type, series in series_by_type.items()
+        }
+        for symbol, series_by_type in partial.items()
+    }
+
+
+def _parse_cache_sources() -> List[Dict[str, Dict[str, Dict[str, Tuple[Any, ...]]]]]:
+    """Parse every file in _CACHE_SOURCES, fanning out to worker processes for large inputs.
+
+    Returns:
+        One partial cache per source, in _CACHE_SOURCES order.
+    """
+    paths = [file_path for file_path, _ in _CACHE_SOURCES]
+    series = [series_types for _, series_types in _CACHE_SOURCES]
+
+    total_bytes = sum(path.stat().st_size for path in paths if path.exists())
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    if max_workers > 1 and total_bytes >= _PARALLEL_LOAD_MIN_BYTES:
+        # fork avoids re-importing this module (and fastmcp) in every worker
+        mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+                return [
+                    _reintern_partial(partial)
+                    for partial in pool.map(_load_jsonl_to_cache_worker, paths, series)
+                ]
+        except (OSError, BrokenProcessPool) as e:
+            print(f"⚠️  Warning: parallel price cache load failed ({e}), loading sequentially")
+
+    return [_load_jsonl_to_cache_worker(path, series_types) for path, series_types in zip(paths, series)]
+
+
+def _cache_sources_signature() -> List[Optional[Tuple[str, int, int]]]:
+    """Return (path, mtime_ns, size) for each cache source, None for missing files."""
+    signature: List[Optional[Tuple[str, int, int]]] = []
+    for file_path, _ in _CACHE_SOURCES:
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((str(file_path), st.st_mtime_ns, st.st_size))
+    return signature
+
+
+def _read_cache_snapshot(signature: List[Optional[Tuple[str, int, int]]]) -> Optional[Dict[str, Any]]:
+    """Load the persisted price cache if it was built from exactly these source files."""
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        with _CACHE_SNAPSHOT_PATH.open("rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️  Warning: ignoring unreadable price cache snapshot {_CACHE_SNAPSHOT_PATH}: {e}")
+        return None
+
+    if not isinstance(snapshot, dict):
+        print(f"⚠️  Warning: ignoring malformed price cache snapshot {_CACHE_SNAPSHOT_PATH}")
+        return None
+    if snapshot.get("version") != _CACHE_SNAPSHOT_VERSION or snapshot.get("sources") != signature:
+        return None
+    cache = snapshot.get("cache")
+    if not isinstance(cache, dict):
+        print(f"⚠️  Warning: ignoring malformed price cache snapshot {_CACHE_SNAPSHOT_PATH}")
+        return None
+    return cache
+
+
+def _write_cache_snapshot(signature: List[Optional[Tuple[str, int, int]]]) -> None:
+    """Atomically persist _PRICE_CACHE (temp file + os.replace) for the next process start."""
+    snapshot = {"version": _CACHE_SNAPSHOT_VERSION, "sources": signature, "cache": _PRICE_CACHE}
+    try:
+        _CACHE_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_SNAPSHOT_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _CACHE_SNAPSHOT_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"⚠️  Warning: could not write price cache snapshot {_CACHE_SNAPSHOT_PATH}: {e}")
+
+
+def _build_lookup_indices() -> None:
+    """Fill the flat row indices and sorted date lists from _PRICE_CACHE."""
+    for cache_type, flat, parse_date in (
+        ("daily", _DAILY_FLAT, _parse_date_daily),
+        ("hourly", _HOURLY_FLAT, _parse_date_hourly),
+    ):
+        dates_by_symbol = _DATES_BY_SYMBOL[cache_type]
+        # Every symbol shares the same trading dates, so parse each distinct string once
+        date_keys: Dict[str, Optional[int]] = {}
+        for symbol, series_by_type in _PRICE_CACHE.items():
+            series = series_by_type.get(cache_type)
+            if series is None:
+                continue
+            for date, row in series.items():
+                if date in date_keys:
+                    key = date_keys[date]
+                else:
+                    try:
+                        key = parse_date(date)
+                    except ValueError:
+                        # No request can validate to this date, so it is never looked up
+                        key = None
+                    date_keys[date] = key
+                if key is not None:
+                    flat.setdefault((symbol, key), row)
+            dates_by_symbol[symbol] = sorted(series)
+
+
+def _reset_cache() -> None:
+    """Empty _PRICE_CACHE and every index derived from it."""
+    _PRICE_CACHE.clear()
+    _DAILY_FLAT.clear()
+    _HOURLY_FLAT.clear()
+    for dates_by_symbol in _DATES_BY_SYMBOL.values():
+        dates_by_symbol.clear()
+    _CLOSE_COLUMNS.clear()
+
+
+def _load_cache_locked() -> None:
+    """Fill _PRICE_CACHE and its indices from the snapshot or the sources. Caller holds _CACHE_INIT_LOCK."""
+    _cache_state[0] = _CACHE_LOADING
+    try:
+        signature = _cache_sources_signature()
+        cached = _read_cache_snapshot(signature)
+        if cached is not None:
+            _PRICE_CACHE.update(cached)
+        else:
+            for partial in _parse_cache_sources():
+                for symbol, series_by_type in partial.items():
+                    existing = _PRICE_CACHE.get(symbol)
+                    if existing is None:
+                        # Common case: the symbol only appears in one source, adopt its dicts as-is
+                        _PRICE_CACHE[symbol] = series_by_type
+                        continue
+                    for cache_type, series in series_by_type.items():
+                        existing.setdefault(cache_type, series)
+            _write_cache_snapshot(signature)
+        _build_lookup_indices()
+    except BaseException:
+        _reset_cache()
+        _cache_state[0] = _CACHE_UNLOADED
+        raise
+    _cache_signature[0] = signature
+    _cache_state[0] = _CACHE_READY
+    _bind_loaded_lookups()
+
+
+def _ensure_cache_loaded() -> None:
+    """Load every price file into _PRICE_CACHE on first use.
+
+    Once loaded, the single-date lookups are rebound to skip this call entirely
+    (see _bind_loaded_lookups).
+    """
+    if _cache_state[0] == _CACHE_READY:
+        return
+    with _CACHE_INIT_LOCK:
+        if _cache_state[0] == _CACHE_READY:
+            return
+        _load_cache_locked()
+
+
+def _reload_if_sources_changed() -> bool:
+    """Reload the price cache if any source file changed since it was loaded.
+
+    Called on lookup misses, so re-running the data step while the MCP services keep
+    running picks up the newly fetched dates, as the old per-request file scan did.
+
+    Returns:
+        True if the cache was (or, in another thread, just got) reloaded and the
+        lookup is worth retrying.
+    """
+    if _cache_sources_signature() == _cache_signature[0]:
+        return False
+    with _CACHE_INIT_LOCK:
+        if _cache_sources_signature() != _cache_signature[0]:
+            _reset_cache()
+            _load_cache_locked()
+    return True
+
+
+_DAILY_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_HOURLY_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2}) ([0-9]{2}):([0-9]{2}):([0-9]{2})")
+
+
+def _parse_date_daily(date_str: str) -> int:
+    """Validate a 'YYYY-MM-DD' date and return its proleptic ordinal, the daily cache key.
+
+    A precompiled fullmatch plus date() is much cheaper than strptime on this hot path,
+    and only accepts the zero-padded spelling, so the TODAY_DATE string comparison
+    stays exact.
+    """
+    m = _DAILY_RE.fullmatch(date_str)
+    try:
+        if m is None:
+            raise ValueError(date_str)
+        year, month, day = m.groups()
+        return _date(int(year), int(month), int(day)).toordinal()
     except ValueError as exc:
         raise ValueError("date must be in YYYY-MM-DD format") from exc
 
-def _validate_date_hourly(date_str: str) -> None:
+def _parse_date_hourly(date_str: str) -> int:
+    """Validate a 'YYYY-MM-DD HH:MM:SS' timestamp and return seconds since day 1, the hourly cache key.
+
+    Computed from the naive fields rather than .timestamp() so the key never depends on
+    the host timezone or DST. Parsed the same way as _parse_date_daily.
+    """
+    m = _HOURLY_RE.fullmatch(date_str)
     try:
-        datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        if m is None:
+            raise ValueError(date_str)
+        year, month, day, hour, minute, second = map(int, m.groups())
+        if hour > 23 or minute > 59 or second > 59:
+            raise ValueError(date_str)
+        return _date(year, month, day).toordinal() * 86400 + hour * 3600 + minute * 60 + second
     except ValueError as exc:
         raise ValueError("date must be in YYYY-MM-DD HH:MM:SS format") from exc
 
@@ -77,11 +467,11 @@ def get_price_local(symbol: str, date: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing symbol, date and ohlcv data.
     """
-    # Detect date format
+    # Detect date format: daily dates are exactly 10 characters, anything longer carries a time
     result = None
-    if ' ' in date or 'T' in date:
+    if len(date) > 10:
         # Contains time component, use hourly
-        result =  get_price_local_hourly(symbol, date)
+        result = get_price_local_hourly(symbol, date)
     else:
         # Date only, use daily
         result = get_price_local_daily(symbol, date)
@@ -100,73 +490,96 @@ def get_price_local(symbol: str, date: str) -> Dict[str, Any]:
 
 
 
-def get_price_local_daily(symbol: str, date: str) -> Dict[str, Any]:
-    """Read OHLCV data for specified stock and date. Get historical information for specified stock.
+def _format_ohlcv_response(symbol: str, date: str, row: Tuple[Any, ...], today: Optional[str]) -> Dict[str, Any]:
+    """Build the tool response for a cached OHLCV row, hiding today's unknown prices.
+
+    today is passed in (from _get_today()) so range callers check it once, not per row.
+    """
+    open_, high, low, close, volume = row
+    if date == today:
+        return {
+            "symbol": symbol,
+            "date": date,
+            "ohlcv": {
+                "open": open_,
+                "high": "You can not get the current high price",
+                "low": "You can not get the current low price",
+                "close": "You can not get the next close price",
+                "volume": "You can not get the current volume",
+            },
+        }
+    return {
+        "symbol": symbol,
+        "date": date,
+        "ohlcv": {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+        },
+    }
+
+
+def _price_lookup_miss(symbol: str, date: str, cache_type: str, data_path: Path) -> Dict[str, Any]:
+    """Build the error response for a (symbol, date) that is not in the flat index.
 
     Args:
-        symbol: Stock symbol, e.g. 'IBM' or '600243.SHH'.
-        date: Date in 'YYYY-MM-DD' format.
+        symbol: Stock symbol.
+        date: Date already validated for the requested granularity.
+        cache_type: 'daily' or 'hourly'.
+        data_path: File the symbol is served from, used for error messages.
 
     Returns:
-        Dictionary containing symbol, date and ohlcv data.
+        Dictionary describing why no OHLCV data was found.
     """
+    dates = _DATES_BY_SYMBOL[cache_type].get(symbol)
+    if dates is None:
+        if not data_path.exists():
+            return {"error": f"Data file not found: {data_path}", "symbol": symbol, "date": date}
+        return {"error": f"No records found for stock {symbol} in local data", "symbol": symbol, "date": date}
+
+    sample_dates = dates[:-6:-1]
+    return {
+        "error": f"Data not found for date {date}. Please verify the date exists in data. Sample available dates: {sample_dates}",
+        "symbol": symbol,
+        "date": date,
+    }
+
+
+def _get_price_local_daily_loaded(symbol: str, date: str) -> Dict[str, Any]:
+    """get_price_local_daily once the price cache is ready; see _bind_loaded_lookups."""
     filename = "merged.jsonl"
     try:
-        _validate_date_daily(date)
+        date_key = _parse_date_daily(date)
     except ValueError as e:
         return {"error": str(e), "symbol": symbol, "date": date}
 
-    data_path = _workspace_data_path(filename, symbol)
-    if not data_path.exists():
-        return {"error": f"Data file not found: {data_path}", "symbol": symbol, "date": date}
+    row = _DAILY_FLAT.get((symbol, date_key))
+    if row is None and _reload_if_sources_changed():
+        row = _DAILY_FLAT.get((symbol, date_key))
+    if row is None:
+        return _price_lookup_miss(symbol, date, "daily", _workspace_data_path(filename, symbol))
+    return _format_ohlcv_response(symbol, date, row, _get_today())
 
-    with data_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            doc = json.loads(line)
-            meta = doc.get("Meta Data", {})
-            if meta.get("2. Symbol") != symbol:
-                continue
-            series = doc.get("Time Series (Daily)", {})
-            day = series.get(date)
-            if day is None:
-                sample_dates = sorted(series.keys(), reverse=True)[:5]
-                return {
-                    "error": f"Data not found for date {date}. Please verify the date exists in data. Sample available dates: {sample_dates}",
-                    "symbol": symbol,
-                    "date": date,
-                }
-            if date == get_config_value("TODAY_DATE"):
-                return {
-                    "symbol": symbol,
-                    "date": date,
-                    "ohlcv": {
-                        "open": day.get("1. buy price"),
-                        "high": "You can not get the current high price",
-                        "low": "You can not get the current low price", 
-                        "close": "You can not get the next close price",
-                        "volume": "You can not get the current volume",
-                    },
-                }
-            else:
-                return {
-                    "symbol": symbol,
-                    "date": date,
-                    "ohlcv": {
-                        "open": day.get("1. buy price"),
-                        "high": day.get("2. high"),
-                        "low": day.get("3. low"), 
-                        "close": day.get("4. sell price"),
-                        "volume": day.get("5. volume"),
-                    },
-                }
 
+def _get_price_local_hourly_loaded(symbol: str, date: str) -> Dict[str, Any]:
+    """get_price_local_hourly once the price cache is ready; see _bind_loaded_lookups."""
+    filename = "merged.jsonl"
+    try:
+        date_key = _parse_date_hourly(date)
+    except ValueError as e:
+        return {"error": str(e), "symbol": symbol, "date": date}
 
-    return {"error": f"No records found for stock {symbol} in local data", "symbol": symbol, "date": date}
+    row = _HOURLY_FLAT.get((symbol, date_key))
+    if row is None and _reload_if_sources_changed():
+        row = _HOURLY_FLAT.get((symbol, date_key))
+    if row is None:
+        return _price_lookup_miss(symbol, date, "hourly", _workspace_data_path(filename))
+    return _format_ohlcv_response(symbol, date, row, _get_today())
 
 
-def get_price_local_hourly(symbol: str, date: str) -> Dict[str, Any]:
+def get_price_local_daily(symbol: str, date: str) -> Dict[str, Any]:
     """Read OHLCV data for specified stock and date. Get historical information for specified stock.
 
     Args:
@@ -176,59 +589,178 @@ def get_price_local_hourly(symbol: str, date: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing symbol, date and ohlcv data.
     """
+    _ensure_cache_loaded()
+    return _get_price_local_daily_loaded(symbol, date)
+
+
+def get_price_local_hourly(symbol: str, date: str) -> Dict[str, Any]:
+    """Read OHLCV data for specified stock and date. Get historical information for specified stock.
+
+    Args:
+        symbol: Stock symbol, e.g. 'IBM' or '600243.SHH'.
+        date: Date in 'YYYY-MM-DD HH:MM:SS' format.
+
+    Returns:
+        Dictionary containing symbol, date and ohlcv data.
+    """
+    _ensure_cache_loaded()
+    return _get_price_local_hourly_loaded(symbol, date)
+
+
+def _bind_loaded_lookups() -> None:
+    """Point the module-level lookup names at their check-free versions.
+
+    get_price_local resolves get_price_local_daily/hourly through module globals on
+    every call, so after the cache is ready the tool goes straight to the lookup with no
+    readiness check. Callers holding the original functions still work; those just
+    take the fast return in _ensure_cache_loaded first.
+    """
+    globals().update(
+        get_price_local_daily=_get_price_local_daily_loaded,
+        get_price_local_hourly=_get_price_local_hourly_loaded,
+    )
+
+
+@mcp.tool()
+def get_prices_local_range(symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
+    """Read OHLCV data for specified stock over an inclusive date range in one call.
+
+    Use this instead of calling get_price_local once per date when you need several
+    dates of one stock. Both bounds use the same format: 'YYYY-MM-DD' for daily data or
+    'YYYY-MM-DD HH:MM:SS' for hourly data. Dates after the current date are never
+    returned, and the current date's row is masked the same way as in get_price_local.
+
+    Args:
+        symbol: Stock symbol, e.g. 'IBM' or '600243.SHH'.
+        start_date: First date of the range.
+        end_date: Last date of the range.
+
+    Returns:
+        Dictionary containing symbol, start_date, end_date and a date -> ohlcv mapping in
+        ascending date order.
+    """
     filename = "merged.jsonl"
+    hourly = len(start_date) > 10
+    parse_date = _parse_date_hourly if hourly else _parse_date_daily
     try:
-        _validate_date_hourly(date)
+        parse_date(start_date)
+        parse_date(end_date)
     except ValueError as e:
-        return {"error": str(e), "symbol": symbol, "date": date}
+        return {"error": str(e), "symbol": symbol, "start_date": start_date, "end_date": end_date}
 
-    data_path = _workspace_data_path(filename)
-    if not data_path.exists():
-        return {"error": f"Data file not found: {data_path}", "symbol": symbol, "date": date}
+    if _cache_state[0] != _CACHE_READY:
+        _ensure_cache_loaded()
+    if hourly:
+        cache_type, data_path = "hourly", _workspace_data_path(filename)
+    else:
+        cache_type, data_path = "daily", _workspace_data_path(filename, symbol)
+
+    dates = _DATES_BY_SYMBOL[cache_type].get(symbol)
+    if (dates is None or dates[-1] < end_date) and _reload_if_sources_changed():
+        dates = _DATES_BY_SYMBOL[cache_type].get(symbol)
+    if dates is None:
+        if not data_path.exists():
+            error = f"Data file not found: {data_path}"
+        else:
+            error = f"No records found for stock {symbol} in local data"
+        return {"error": error, "symbol": symbol, "start_date": start_date, "end_date": end_date}
+
+    series = _PRICE_CACHE[symbol][cache_type]
+    today = _get_today()
+    stop = bisect_right(dates, end_date)
+    if today:
+        if hourly or len(today) <= 10:
+            # Up to and including today, whose row is masked below
+            stop = min(stop, bisect_right(dates, today))
+        else:
+            # An hourly TODAY_DATE is mid-session, so today's daily row would leak its close
+            stop = min(stop, bisect_left(dates, today[:10]))
+    prices = {}
+    for date in dates[bisect_left(dates, start_date) : stop]:
+        prices[date] = _format_ohlcv_response(symbol, date, series[date], today)["ohlcv"]
+    return {"symbol": symbol, "start_date": start_date, "end_date": end_date, "prices": prices}
 
-    with data_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            doc = json.loads(line)
-            meta = doc.get("Meta Data", {})
-            if meta.get("2. Symbol") != symbol:
-                continue
-            series = doc.get("Time Series (60min)", {})
-            day = series.get(date)
-            if day is None:
-                sample_dates = sorted(series.keys(), reverse=True)[:5]
-                return {
-                    "error": f"Data not found for date {date}. Please verify the date exists in data. Sample available dates: {sample_dates}",
-                    "symbol": symbol,
-                    "date": date
-                }
-            if date == get_config_value("TODAY_DATE"):
-                return {
-                    "symbol": symbol,
-                    "date": date,
-                    "ohlcv": {
-                        "open": day.get("1. buy price"),
-                        "high": "You can not get the current high price",
-                        "low": "You can not get the current low price", 
-                        "close": "You can not get the next close price",
-                        "volume": "You can not get the current volume",
-                    },
-                }
-            else:
-                return {
-                    "symbol": symbol,
-                    "date": date,
-                    "ohlcv": {
-                        "open": day.get("1. buy price"),
-                        "high": day.get("2. high"),
-                        "low": day.get("3. low"), 
-                        "close": day.get("4. sell price"),
-                        "volume": day.get("5. volume"),
-                    },
-                }
 
-    return {"error": f"No records found for stock {symbol} in local data", "symbol": symbol, "date": date}
+@mcp.tool()
+def get_cache_stats() -> Dict[str, Any]:
+    """Summarize the in-memory price cache.
+
+    Returns:
+        Dictionary with whether the cache is loaded, the number of symbols, and the
+        number of daily and hourly OHLCV rows. Counts come from the flat indices, so
+        this is O(1).
+    """
+    return {
+        "loaded": _cache_state[0] == _CACHE_READY,
+        "symbols": len(_PRICE_CACHE),
+        "daily_rows": len(_DAILY_FLAT),
+        "hourly_rows": len(_HOURLY_FLAT),
+    }
+
+
+def _close_column(symbol: str, cache_type: str) -> Optional[Tuple[List[str], Any]]:
+    """Return (dates, closes) for one symbol as a float64 NumPy column, building it once."""
+    key = (cache_type, symbol)
+    column = _CLOSE_COLUMNS.get(key)
+    if column is not None:
+        return column
+
+    dates = _DATES_BY_SYMBOL[cache_type].get(symbol)
+    if dates is None:
+        return None
+    series = _PRICE_CACHE[symbol][cache_type]
+    column_dates: List[str] = []
+    closes: List[float] = []
+    for date in dates:
+        try:
+            close = float(series[date][3])
+        except (TypeError, ValueError):
+            continue
+        column_dates.append(date)
+        closes.append(close)
+
+    column = (column_dates, np.asarray(closes, dtype=np.float64))
+    _CLOSE_COLUMNS[key] = column
+    return column
+
+
+@mcp.tool()
+def get_symbol_returns(symbol: str, frequency: str = "daily") -> Dict[str, Any]:
+    """Compute close-to-close log returns for specified stock from the local price cache.
+
+    Only closes strictly before TODAY_DATE are used, since today's close is not known yet.
+    For daily data only the date part of an hourly TODAY_DATE is compared.
+
+    Args:
+        symbol: Stock symbol, e.g. 'IBM' or '600243.SHH'.
+        frequency: 'daily' or 'hourly'.
+
+    Returns:
+        Dictionary containing symbol, frequency, the dates each return ends on and the
+        log returns, both in ascending date order.
+    """
+    if frequency not in ("daily", "hourly"):
+        return {"error": "frequency must be 'daily' or 'hourly'", "symbol": symbol, "frequency": frequency}
+
+    if _cache_state[0] != _CACHE_READY:
+        _ensure_cache_loaded()
+    column = _close_column(symbol, frequency)
+    if column is None:
+        return {"error": f"No records found for stock {symbol} in local data", "symbol": symbol, "frequency": frequency}
+
+    dates, closes = column
+    today = _get_today()
+    if today and frequency == "daily":
+        # Hourly agents set TODAY_DATE to a timestamp, which sorts after today's daily key
+        today = today[:10]
+    end = bisect_left(dates, today) if today else len(dates)
+    log_returns = np.diff(np.log(closes[:end]))
+    return {
+        "symbol": symbol,
+        "frequency": frequency,
+        "dates": dates[1:end],
+        "log_returns": log_returns.tolist(),
+    }
 
 
 def get_price_local_function(symbol: str, date: str, filename: str = "merged.jsonl") -> Dict[str, Any]:
@@ -255,7 +787,7 @@ def get_price_local_function(symbol: str, date: str, filename: str = "merged.jso
         for line in f:
             if not line.strip():
                 continue
-            doc = json.loads(line)
+            doc = _json_loads(line)
             meta = doc.get("Meta Data", {})
             if meta.get("2. Symbol") != symbol:
                 continue
@@ -32,6 +32,11 @@ def _resolve_runtime_env_path() -> str:
     return path
 
 
+def get_runtime_env_path() -> str:
+    """Return the runtime env file path that get_config_value/write_config_value use."""
+    return _resolve_runtime_env_path()
+
+
 def _load_runtime_env() -> dict:
     path = _resolve_runtime_env_path()
     if path is None: